@@ -4,6 +4,7 @@ import abc
 import dataclasses
 import functools
 import logging
+import types
 import typing as t
 import warnings
 from pathlib import Path
@@ -464,19 +465,198 @@ def _get_parser_for_annotation(
     ) from None
 
 
+# How many paths each `_RouteTable` remembers the matching page for
+_MAX_CACHED_MATCHES_PER_TABLE = 1024
+
+
+@dataclasses.dataclass(frozen=True)
+class _RouteTable:
+    """
+    Speeds up finding the page that matches a URL.
+
+    Most pages have a single, static URL segment such as `"settings"`. Rather
+    than trying every page's regex in order, those are looked up in a
+    dictionary. Only pages with path parameters, multiple segments or non-ASCII
+    characters still have to be tried one by one.
+    """
+
+    # The pages this table was built from, in order
+    pages: tuple[ComponentPage | Redirect, ...]
+
+    # Maps the lowercase URL segment of each static page to the index of the
+    # first page with that segment
+    static_page_indices: dict[str, int]
+
+    # The indices of all pages that can't be looked up by segment, in order
+    dynamic_page_indices: tuple[int, ...]
+
+    # Results of `match`, keyed by path. The paths come from users, so the cache
+    # is cleared whenever it grows too large.
+    _match_cache: dict[
+        str, tuple[ComponentPage | Redirect, t.Mapping[str, object], str] | None
+    ] = dataclasses.field(
+        default_factory=dict,
+        init=False,
+        repr=False,
+        compare=False,
+    )
+
+    @staticmethod
+    def build(pages: tuple[ComponentPage | Redirect, ...]) -> _RouteTable:
+        static_page_indices: dict[str, int] = {}
+        dynamic_page_indices: list[int] = []
+
+        for index, page in enumerate(pages):
+            url_segment = page.url_segment
+
+            if (
+                "{" in url_segment
+                or "/" in url_segment
+                or not url_segment.isascii()
+            ):
+                dynamic_page_indices.append(index)
+            else:
+                static_page_indices.setdefault(url_segment.lower(), index)
+
+        return _RouteTable(
+            pages=pages,
+            static_page_indices=static_page_indices,
+            dynamic_page_indices=tuple(dynamic_page_indices),
+        )
+
+    def candidate_pages(
+        self,
+        remaining_path: str,
+    ) -> t.Sequence[ComponentPage | Redirect]:
+        """
+        Returns the pages that could possibly match the given path, in the
+        order in which they must be tried. This is a subset of all pages, so
+        the result must still be verified using the pages' URL patterns.
+        """
+        url_segment = remaining_path.partition("/")[0]
+
+        # URL patterns are case insensitive, and Unicode case folding can make
+        # non-ASCII characters match ASCII ones (e.g. the Kelvin sign matches
+        # "k"). Fall back to trying all pages.
+        if not url_segment.isascii():
+            return self.pages
+
+        static_index = self.static_page_indices.get(
+            url_segment.lower(), len(self.pages)
+        )
+
+        # Dynamic pages defined before the static one take precedence
+        result = [
+            self.pages[index]
+            for index in self.dynamic_page_indices
+            if index < static_index
+        ]
+
+        if static_index < len(self.pages):
+            result.append(self.pages[static_index])
+
+        return result
+
+    def match(
+        self,
+        remaining_path: str,
+    ) -> tuple[ComponentPage | Redirect, t.Mapping[str, object], str] | None:
+        """
+        Finds the first page that matches the given path. Returns the page, its
+        parsed path arguments and the remaining, unmatched part of the path. If
+        no page matches, returns `None`.
+
+        Matching only depends on the pages and the path, so the results are
+        cached. Guards on the other hand may depend on arbitrary session state,
+        and are thus never part of this. Since the path arguments are shared
+        between all callers, they are returned as a read-only mapping.
+        """
+        try:
+            return self._match_cache[remaining_path]
+        except KeyError:
+            pass
+
+        result = self._match_uncached(remaining_path)
+
+        if len(self._match_cache) >= _MAX_CACHED_MATCHES_PER_TABLE:
+            self._match_cache.clear()
+
+        self._match_cache[remaining_path] = result
+        return result
+
+    def _match_uncached(
+        self,
+        remaining_path: str,
+    ) -> tuple[ComponentPage | Redirect, t.Mapping[str, object], str] | None:
+        for page in self.candidate_pages(remaining_path):
+            did_match, raw_path_arguments, remainder = page._url_pattern.match(
+                remaining_path
+            )
+
+            if not did_match:
+                continue
+
+            # Try parsing the path arguments
+            if isinstance(page, rio.ComponentPage):
+                try:
+                    path_arguments = {
+                        name: page._url_parameter_parsers[name].parse(value)
+                        for name, value in raw_path_arguments.items()
+                    }
+                except ValueError:
+                    continue
+
+            else:
+                path_arguments = raw_path_arguments
+
+            # The result is cached and shared between all callers, so make sure
+            # the arguments can't be modified
+            return page, types.MappingProxyType(path_arguments), remainder
+
+        return None
+
+
+def _get_route_table(
+    owner: rio.App | ComponentPage,
+    pages: t.Iterable[ComponentPage | Redirect],
+) -> _RouteTable:
+    """
+    Returns the route table for the given pages, building it if necessary.
+
+    The table is cached on the object that owns the pages, i.e. the app or the
+    parent page. Pages are sometimes added after the owner has been created
+    (e.g. when detecting them from files), so the cached table is rebuilt if
+    the pages no longer match.
+
+    Note that this check is still linear in the number of pages. It only
+    compares object identities though, which is much cheaper than matching
+    each page's regex. There is no cheaper key that reliably detects in-place
+    modifications of the page sequence.
+    """
+    pages = tuple(pages)
+    route_table: _RouteTable | None = vars(owner).get("_route_table_")
+
+    if route_table is None or route_table.pages != pages:
+        route_table = _RouteTable.build(pages)
+        vars(owner)["_route_table_"] = route_table
+
+    return route_table
+
+
 def _get_active_page_instances(
     *,
-    available_pages: t.Iterable[rio.ComponentPage | rio.Redirect],
+    route_table: _RouteTable,
     remaining_path: str,
 ) -> list[
     tuple[
         rio.ComponentPage | rio.Redirect,
-        dict[str, object],
+        t.Mapping[str, object],
     ]
 ]:
     """
-    Given a list of available pages, and a URL, return the list of pages that
-    would be active if navigating to that URL. Each result entry contains the
+    Given the route table of the available pages, and a URL, return the list of
+    pages that would be active if navigating to that URL. Each result entry
+    contains the
 
     - Page (ComponentPage / Redirect) that would be active
     - The path arguments passed to that page
@@ -488,35 +668,15 @@ def _get_active_page_instances(
     assert not remaining_path.startswith("/"), remaining_path
 
     # Get the first matching page
-    for page in available_pages:
-        did_match, raw_path_arguments, remainder = page._url_pattern.match(
-            remaining_path
-        )
-
-        if not did_match:
-            continue
-
-        # Try parsing the path arguments
-        if isinstance(page, rio.ComponentPage):
-            try:
-                path_arguments = {
-                    name: page._url_parameter_parsers[name].parse(value)
-                    for name, value in raw_path_arguments.items()
-                }
-            except ValueError:
-                continue
-
-        else:
-            path_arguments = raw_path_arguments
-
-        break
+    match = route_table.match(remaining_path)
 
     # No matching page found
-    else:
+    if match is None:
         return []
 
+    page, path_arguments, remainder = match
+
     # Remember this page
-    path_arguments = t.cast(dict[str, object], path_arguments)
     active_pages = [
         (page, path_arguments),
     ]
@@ -524,7 +684,7 @@ def _get_active_page_instances(
     # Recurse into the children
     if isinstance(page, rio.ComponentPage):
         active_pages += _get_active_page_instances(
-            available_pages=page.children,
+            route_table=_get_route_table(page, page.children),
             remaining_path=remainder,
         )
 
@@ -565,7 +725,7 @@ def check_page_guards(
     target_url_absolute: rio.URL,
 ) -> tuple[
     tuple[
-        tuple[ComponentPage, dict[str, object]],
+        tuple[ComponentPage, t.Mapping[str, object]],
         ...,
     ]
     | None,
@@ -622,7 +782,7 @@ def check_page_guards(
         # Find all pages which would by activated by this navigation
         active_page_instances_and_path_arguments = tuple(
             _get_active_page_instances(
-                available_pages=sess.app.pages,
+                route_table=_get_route_table(sess.app, sess.app.pages),
                 remaining_path=target_url_relative.path,
             )
         )
@@ -3,6 +3,7 @@ from __future__ import annotations
 import asyncio
 import collections
 import copy
+import functools
 import inspect
 import json
 import logging
@@ -63,6 +64,32 @@ class WontSerialize(Exception):
     pass
 
 
+@functools.lru_cache(maxsize=1024)
+def _make_url_absolute_cached(
+    base_url: rio.URL,
+    active_page_url: rio.URL,
+    url: str | rio.URL,
+) -> rio.URL:
+    """
+    The implementation of `Session._make_url_absolute`. URLs are immutable and
+    hashable, and the same links are resolved over and over again (every
+    navigation and every rendered `Link`), so the results are cached.
+    """
+    url = rio.URL(url)
+
+    if url.is_absolute():
+        return url
+
+    if url.path.startswith("/"):
+        return (
+            (base_url / url.path.removeprefix("/"))
+            .with_query(url.query)
+            .with_fragment(url.fragment)
+        )
+
+    return active_page_url.join(url)
+
+
 class Session(unicall.Unicall):
     """
     Represents a single client connection to the app.
@@ -269,7 +296,7 @@ class Session(unicall.Unicall):
         # the correct values.
         self._active_page_url = active_page_url
         self._active_page_instances_and_path_arguments: tuple[
-            tuple[rio.ComponentPage, dict[str, object]], ...
+            tuple[rio.ComponentPage, t.Mapping[str, object]], ...
         ] = tuple()
         self._active_page_instances: tuple[rio.ComponentPage, ...] = tuple()
 
@@ -1008,22 +1035,14 @@ window.resizeTo(screen.availWidth, screen.availHeight);
         `/`. If the url starts with `/`, we append it to the base url - that
         means if the base url has a path, that path is not erased!
         """
-        url = rio.URL(url)
-
-        if url.is_absolute():
-            return url
-
-        if url.path.startswith("/"):
-            return (
-                (self._base_url / url.path.removeprefix("/"))
-                .with_query(url.query)
-                .with_fragment(url.fragment)
-            )
-
         if active_page_url_override is None:
             active_page_url_override = self._active_page_url
 
-        return active_page_url_override.join(url)
+        return _make_url_absolute_cached(
+            self._base_url,
+            active_page_url_override,
+            url,
+        )
 
     def navigate_to(
         self,
@@ -0,0 +1,20 @@
+import pytest
+
+import rio.serialization
+
+
+@pytest.fixture(params=["json", "orjson"])
+def json_encoder(
+    request: pytest.FixtureRequest,
+    monkeypatch: pytest.MonkeyPatch,
+) -> str:
+    """
+    Runs the test once with each encoder `rio.serialization.serialize_json` can
+    use. The `orjson` variant is skipped if orjson isn't installed.
+    """
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(rio.serialization, "orjson", None)
+
+    return request.param
@@ -87,6 +87,16 @@ PAGES = [
 ]
 
 
+# Building an app and session is comparatively expensive, and the routing
+# system only reads from the session. Share a single one between all redirect
+# tests.
+@pytest.fixture(scope="module")
+def routing_session() -> rio.Session:
+    app = rio.App(pages=PAGES)
+    app_server = rio.app_server.TestingServer(app)
+    return app_server.create_dummy_session()
+
+
 @pytest.mark.parametrize(
     "relative_url_before_redirects, relative_url_after_redirects_should",
     [
@@ -154,15 +164,13 @@ PAGES = [
 def test_redirects(
     relative_url_before_redirects: str,
     relative_url_after_redirects_should: str,
+    routing_session: rio.Session,
 ) -> None:
     """
     Simulate navigation to URLs, run any guards, and make sure the final,
     resulting URL is correct.
     """
-    # Create a fake session. It contains everything used by the routing system.
-    app = rio.App(pages=PAGES)
-    app_server = rio.app_server.TestingServer(app)
-    session = app_server.create_dummy_session()
+    session = routing_session
 
     # Determine the final URL
     active_pages_and_path_arguments, absolute_url_after_redirects_is = (
@@ -216,19 +224,52 @@ def test_url_parameter_parsing_failure() -> None:
     assert active_pages_and_path_arguments[0][1] == {"path_param": 3.5}
 
 
-def test_redirect_offsite() -> None:
+def test_path_arguments_are_read_only() -> None:
     """
-    Redirect to a site other than this app.
+    Page matches are cached and shared between sessions, so the path arguments
+    must not be modifiable.
     """
-    page = rio.ComponentPage(
-        name="Home",
-        url_segment="",
-        build=FakeComponent,
+
+    def build_user_page(user_id: int) -> rio.Component:
+        return rio.Text(str(user_id))
+
+    user_page = rio.ComponentPage(
+        name="User Page",
+        url_segment="users/{user_id}",
+        build=build_user_page,
     )
 
-    app = rio.App(pages=(page,))
+    app = rio.App(pages=(user_page,))
     app_server = rio.app_server.TestingServer(app)
-    session = app_server.create_dummy_session()
+    url = rio.URL("http://localhost/users/3")
+
+    active_pages_and_path_arguments, _ = rio.routing.check_page_guards(
+        app_server.create_dummy_session(),
+        url,
+    )
+
+    assert active_pages_and_path_arguments is not None
+    path_arguments = active_pages_and_path_arguments[0][1]
+
+    with pytest.raises(TypeError):
+        path_arguments["user_id"] = 4  # type: ignore
+
+    # Another session navigating to the same URL gets the original values
+    active_pages_and_path_arguments, _ = rio.routing.check_page_guards(
+        app_server.create_dummy_session(),
+        url,
+    )
+
+    assert active_pages_and_path_arguments is not None
+    assert active_pages_and_path_arguments[0][1] == {"user_id": 3}
+
+
+def test_redirect_offsite(routing_session: rio.Session) -> None:
+    """
+    Redirect to a site other than this app.
+    """
+    # The app's pages don't matter here, so the shared session is fine
+    session = routing_session
 
     external_url = rio.URL("http://example.com")
 
@@ -241,3 +282,130 @@ def test_redirect_offsite() -> None:
 
     assert active_pages_and_path_arguments is None
     assert absolute_url_after_redirects == external_url
+
+
+def test_page_precedence() -> None:
+    """
+    Pages are matched in the order they were passed to the app, regardless of
+    whether their URL segment contains path parameters.
+    """
+
+    def build_dynamic_page(path_param: str) -> rio.Component:
+        return rio.Text(path_param)
+
+    dynamic_page = rio.ComponentPage(
+        name="Dynamic Page",
+        url_segment="{path_param}",
+        build=build_dynamic_page,
+    )
+
+    static_page = rio.ComponentPage(
+        name="Static Page",
+        url_segment="static",
+        build=FakeComponent,
+    )
+
+    for pages, expected_page in (
+        ((dynamic_page, static_page), dynamic_page),
+        ((static_page, dynamic_page), static_page),
+    ):
+        app = rio.App(pages=pages)
+        app_server = rio.app_server.TestingServer(app)
+        session = app_server.create_dummy_session()
+
+        active_pages_and_path_arguments, _ = rio.routing.check_page_guards(
+            session,
+            session._base_url.join(rio.URL("/Static")),
+        )
+
+        assert active_pages_and_path_arguments is not None
+        assert active_pages_and_path_arguments[0][0] == expected_page
+
+
+def test_guards_run_on_every_navigation() -> None:
+    """
+    Page matching is cached, but guards may depend on session state and must
+    therefore be run every time.
+    """
+    is_logged_in = False
+
+    def guard(event: rio.GuardEvent) -> str | None:
+        return None if is_logged_in else "/login"
+
+    pages = (
+        rio.ComponentPage(
+            name="Login",
+            url_segment="login",
+            build=FakeComponent,
+        ),
+        rio.ComponentPage(
+            name="Profile",
+            url_segment="profile",
+            build=FakeComponent,
+            guard=guard,
+        ),
+    )
+
+    app = rio.App(pages=pages)
+    app_server = rio.app_server.TestingServer(app)
+    session = app_server.create_dummy_session()
+
+    profile_url = session._base_url.join(rio.URL("/profile"))
+
+    _, url_after_redirects = rio.routing.check_page_guards(session, profile_url)
+    assert url_after_redirects == session._base_url.join(rio.URL("/login"))
+
+    is_logged_in = True
+
+    _, url_after_redirects = rio.routing.check_page_guards(session, profile_url)
+    assert url_after_redirects == profile_url
+
+
+def test_pages_added_after_navigation() -> None:
+    """
+    Pages can be added to the app and to existing pages after the app has been
+    created, e.g. when detecting them from files. Make sure navigation picks
+    them up, even if routing has been used before.
+    """
+    parent_page = rio.ComponentPage(
+        name="Parent",
+        url_segment="parent",
+        build=FakeComponent,
+    )
+
+    app = rio.App(pages=[parent_page])
+    app_server = rio.app_server.TestingServer(app)
+    session = app_server.create_dummy_session()
+
+    def find_pages(relative_url: str) -> list[rio.ComponentPage]:
+        active_pages_and_path_arguments, _ = rio.routing.check_page_guards(
+            session,
+            session._base_url.join(rio.URL(relative_url)),
+        )
+
+        assert active_pages_and_path_arguments is not None
+        return [page for page, _ in active_pages_and_path_arguments]
+
+    # Navigate before adding any pages, so the route tables are built
+    assert find_pages("/new-page") == []
+    assert find_pages("/parent/child") == [parent_page]
+
+    # Add the pages
+    new_page = rio.ComponentPage(
+        name="New Page",
+        url_segment="new-page",
+        build=FakeComponent,
+    )
+
+    child_page = rio.ComponentPage(
+        name="Child",
+        url_segment="child",
+        build=FakeComponent,
+    )
+
+    t.cast(list, app.pages).append(new_page)
+    t.cast(list, parent_page.children).append(child_page)
+
+    # Navigate again
+    assert find_pages("/new-page") == [new_page]
+    assert find_pages("/parent/child") == [parent_page, child_page]
@@ -0,0 +1,158 @@
+import dataclasses
+import datetime
+import enum
+import json
+import math
+import typing as t
+import uuid
+
+import pytest
+
+import rio.serialization
+
+orjson = pytest.importorskip("orjson")
+
+try:
+    import numpy  # type: ignore
+except ImportError:
+    numpy = None
+
+requires_numpy = pytest.mark.skipif(
+    numpy is None,
+    reason="numpy is not installed",
+)
+
+
+class _Color(enum.Enum):
+    RED = "red"
+
+
+@dataclasses.dataclass
+class _Point:
+    x: int
+    y: int
+
+
+def _serialize_with_json(
+    monkeypatch: pytest.MonkeyPatch,
+    data: object,
+) -> str:
+    with monkeypatch.context() as patch:
+        patch.setattr(rio.serialization, "orjson", None)
+        return rio.serialization.serialize_json(data)  # type: ignore
+
+
+def _serialize_with_orjson(
+    monkeypatch: pytest.MonkeyPatch,
+    data: object,
+) -> str:
+    """
+    Serializes the data, failing if `serialize_json` falls back to the `json`
+    module.
+    """
+
+    def fail(*args, **kwargs) -> t.NoReturn:
+        raise AssertionError("`serialize_json` fell back to the `json` module")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(rio.serialization.json, "dumps", fail)
+        return rio.serialization.serialize_json(data)  # type: ignore
+
+
+@pytest.mark.parametrize(
+    "make_data",
+    [
+        lambda: {"foo": "bar", "number": 3, "float": 1.5, "none": None},
+        lambda: {3: "int", 2.5: "float", True: "bool", None: "none"},
+        lambda: {"list": [1, [2, 3], {"deep": (4, 5)}], "text": "a, b"},
+        pytest.param(
+            lambda: [numpy.int64(1), numpy.float32(2.5), numpy.float64(-4)],
+            marks=requires_numpy,
+        ),
+        pytest.param(
+            lambda: {"text": numpy.str_("numpy"), "int": numpy.int8(-3)},
+            marks=requires_numpy,
+        ),
+    ],
+    ids=["plain", "non-str-keys", "nested", "numpy-numbers", "numpy-mixed"],
+)
+def test_orjson_output_matches_json(
+    monkeypatch: pytest.MonkeyPatch,
+    make_data: t.Callable[[], object],
+) -> None:
+    data = make_data()
+
+    result_json = _serialize_with_json(monkeypatch, data)
+    result_orjson = _serialize_with_orjson(monkeypatch, data)
+
+    assert json.loads(result_orjson) == json.loads(result_json)
+
+
+def test_orjson_falls_back_to_json(monkeypatch: pytest.MonkeyPatch) -> None:
+    # Too large for orjson, which only supports 64 bit integers
+    data = [2**70]
+
+    result_json = _serialize_with_json(monkeypatch, data)
+    result_orjson = rio.serialization.serialize_json(data)  # type: ignore
+
+    assert result_orjson == result_json
+
+
+def test_orjson_encodes_nan_as_null(monkeypatch: pytest.MonkeyPatch) -> None:
+    data = [math.nan, math.inf, -math.inf]
+
+    result_json = _serialize_with_json(monkeypatch, data)
+    result_orjson = _serialize_with_orjson(monkeypatch, data)
+
+    assert result_json == "[NaN, Infinity, -Infinity]"
+    assert result_orjson == "[null,null,null]"
+
+
+@pytest.mark.parametrize(
+    "make_data",
+    [
+        lambda: _Point(1, 2),
+        lambda: datetime.datetime(2024, 1, 1),
+        pytest.param(lambda: numpy.array([1, 2, 3]), marks=requires_numpy),
+    ],
+    ids=["dataclass", "datetime", "numpy-array"],
+)
+def test_orjson_rejects_what_json_rejects(
+    monkeypatch: pytest.MonkeyPatch,
+    make_data: t.Callable[[], object],
+) -> None:
+    data = make_data()
+
+    with pytest.raises(TypeError):
+        _serialize_with_json(monkeypatch, data)
+
+    with pytest.raises(TypeError):
+        rio.serialization.serialize_json(data)  # type: ignore
+
+
+@pytest.mark.parametrize(
+    "data, expected_result",
+    [
+        (_Color.RED, "red"),
+        (
+            uuid.UUID("12345678-1234-5678-1234-567812345678"),
+            "12345678-1234-5678-1234-567812345678",
+        ),
+        ({_Color.RED: 1}, {"red": 1}),
+    ],
+    ids=["enum", "uuid", "enum-keys"],
+)
+def test_orjson_accepts_more_than_json(
+    monkeypatch: pytest.MonkeyPatch,
+    data: object,
+    expected_result: object,
+) -> None:
+    """
+    These are known differences between the encoders, documented in
+    `serialize_json`.
+    """
+    with pytest.raises(TypeError):
+        _serialize_with_json(monkeypatch, data)
+
+    result_orjson = _serialize_with_orjson(monkeypatch, data)
+    assert json.loads(result_orjson) == expected_result